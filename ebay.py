@@ -3,13 +3,75 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from queue import Queue
+from typing import List
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser
+import requests
+import orjson
+import sys
 
 
 TEST_URL = "https://www.ebay.com/itm/404265004322"
 
+# css selectors of product fields, shared by browser and static HTML paths
+_NAME_SELECTOR = ".x-item-title__mainTitle"
+_IMG_SELECTOR = ("#PicturePanel .ux-image-carousel-container .zoom "
+                 ".ux-image-carousel-item.image-treatment.image img")
+_PRICE_SELECTOR = ".x-price-section .x-bin-price__content .x-price-primary .ux-textspans"
+_SELLER_SELECTOR = ".x-sellercard-atf__info__about-seller"
+_SHIPPING_SELECTOR = (".ux-layout-section--shipping .ux-labels-values--shipping "
+                      ".ux-labels-values__values .ux-textspans--BOLD")
+
+# script for reading all product fields in page at once
+_EXTRACT_JS = f"""
+return {{
+    name: document.querySelector('{_NAME_SELECTOR}')?.innerText ?? null,
+    path_img: Array.from(document.querySelectorAll('{_IMG_SELECTOR}'))
+                   .map(img => img.getAttribute('data-zoom-src')),
+    price: document.querySelector('{_PRICE_SELECTOR}')?.innerText ?? null,
+    seller: document.querySelector('{_SELLER_SELECTOR}')?.title ?? null,
+    shipping_cost: document.querySelector('{_SHIPPING_SELECTOR}')?.innerText ?? null,
+}};
+"""
+
+
+def _missing_fields(data: dict) -> List[str]:
+    """Find product fields that weren't found on page.
+    Image list is missing if it's empty or has image without path.
+
+    :param data:
+        Info for product.
+    :returns:
+        Names of missing fields.
+    """
+
+    return [key for key, value in data.items()
+            if value is None or (isinstance(value, list) and (not value or None in value))]
+
+
+@lru_cache(maxsize=1)
+def _driver_path() -> str:
+    """Install chromedriver once per process.
+
+    :returns:
+        Path to chromedriver.
+    """
+
+    return ChromeDriverManager().install()
+
+
+# shared HTTP session for static page fetches
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=16))
+_session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                                       "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+                         "Accept-Language": "en-US"})
+
 
 class EBay:
     """Scraping page of the product, output result to console or file.
@@ -20,23 +82,78 @@ class EBay:
 
     path_file = "temp.json"
 
-    def __init__(self, headless: bool = True):
-        """Create Chrome driver and set options.
+    def __init__(self, headless: bool = True, no_sandbox: bool = False):
+        """Set browser options, Chrome driver is created on first use.
 
         :param headless:
             Enable or disable headless mode for browser (default=True).
+
+        :param no_sandbox:
+            Disable Chrome sandbox, needed only when running as root
+            in container (default=False).
+        """
+
+        self.headless = headless
+        self.no_sandbox = no_sandbox
+        self._browser = None
+
+    @property
+    def browser(self) -> webdriver.Chrome:
+        """Chrome driver, started on first access.
+
+        :returns:
+            Chrome driver.
+        """
+
+        if self._browser is None:
+            self._browser = self._create_driver()
+        return self._browser
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Create Chrome driver and set options.
+
+        :returns:
+            Chrome driver.
         """
         
         # Chrome options
         options = webdriver.ChromeOptions()
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        if headless:
+        if self.headless:
             options.add_argument("--headless=new")
 
+        # images and extra features aren't needed for scraping,
+        # path_img is read from attributes
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-dev-shm-usage")
+        # sandbox protects from loaded third-party pages and doesn't slow down,
+        # disable it only where Chrome can't start otherwise (root in container)
+        if self.no_sandbox:
+            options.add_argument("--no-sandbox")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2,
+                                                  "profile.default_content_setting_values.notifications": 2})
+        # return from get() at DOMContentLoaded
+        options.page_load_strategy = "eager"
+
         # chrome driver
-        self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()),
+        browser = webdriver.Chrome(service=ChromeService(_driver_path()),
                                    options=options)
-        self.browser.implicitly_wait(2)
+        return browser
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Quit Chrome driver if it was started."""
+
+        if self._browser is not None:
+            self._browser.quit()
+            self._browser = None
     
 
     def write_to_file(self, data: dict):
@@ -46,11 +163,14 @@ class EBay:
             Output data.
         """
         
-        with open(self.path_file, "w") as f:
-            try:
-                f.write(json.dumps(data, indent=4))
-            except json.JSONDecodeError as ex:
-                print(f"JSONDecodeError {ex}")
+        # serialize before open, so existing file isn't truncated on error
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError as ex:
+            print(f"TypeError {ex}")
+            return
+        with open(self.path_file, "wb") as f:
+            f.write(payload)
 
     def write_to_console(self, data: dict):
         """Output JSON to console
@@ -60,9 +180,20 @@ class EBay:
         """
         
         try:
-            print(json.dumps(data, indent=4))
-        except json.JSONDecodeError as ex:
-            print(f"JSONDecodeError {ex}")
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError as ex:
+            print(f"TypeError {ex}")
+            return
+
+        # text-only streams (StringIO, IDLE) have no binary buffer
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            print(payload.decode())
+            return
+        # flush pending text output before writing bytes directly
+        sys.stdout.flush()
+        buffer.write(payload + b"\n")
+        buffer.flush()
 
     def scrapper(self, url: str) -> dict:
         """Scraping info for product.
@@ -73,42 +204,136 @@ class EBay:
             Info for product.
         """
 
-        self.browser.get(url)
-        result = {}
+        return self._extract(self.browser, url)
+
+    def scrapper_fast(self, url: str) -> dict:
+        """Scraping info for product from static HTML without browser.
+        Falls back to scrapper if page can't be fetched or parsed.
+
+        :param url:
+            Url to page.
+        :returns:
+            Info for product.
+        """
+
+        try:
+            response = _session.get(url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as ex:
+            print(f"Static fetch failed, use browser: {ex}")
+            return self.scrapper(url)
+
+        tree = HTMLParser(response.text)
+        name = tree.css_first(_NAME_SELECTOR)
+        price = tree.css_first(_PRICE_SELECTOR)
+        seller = tree.css_first(_SELLER_SELECTOR)
+        shipping_cost = tree.css_first(_SHIPPING_SELECTOR)
+        data = {"name": name.text(strip=True) if name else None,
+                "path_img": [img.attrs.get("data-zoom-src") for img in tree.css(_IMG_SELECTOR)],
+                "price": price.text(strip=True) if price else None,
+                "seller": seller.attrs.get("title") if seller else None,
+                "shipping_cost": shipping_cost.text(strip=True) if shipping_cost else None}
+
+        # same check as browser path, so both return the same result
+        missing = _missing_fields(data)
+        if missing:
+            print(f"Static parse failed, not found: {', '.join(missing)}, use browser")
+            return self.scrapper(url)
+        data["current_url"] = url
+        return data
+
+    def scrapper_many(self, urls: List[str], workers: int = 4) -> List[dict]:
+        """Scraping info for several products in parallel.
+        Every worker uses its own Chrome driver, one of them is self.browser.
+
+        :param urls:
+            Urls to pages.
+        :param workers:
+            Max number of parallel browsers (default=4).
+        :returns:
+            Info for products in order of urls, None for failed pages.
+        :raises ValueError:
+            If workers is less than 1.
+        """
+
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if not urls:
+            return []
+        workers = min(workers, len(urls))
+
+        pool = Queue()
+        pool.put(self.browser)
+
+        def add_to_pool(future):
+            if future.exception() is None:
+                pool.put(future.result())
+            else:
+                print(f"Can't start Chrome driver: {future.exception()}")
+
+        def task(url: str) -> dict:
+            driver = pool.get()
+            try:
+                return self._extract(driver, url)
+            except WebDriverException as ex:
+                # failed page mustn't abort the whole batch
+                print(f"WebDriverException for {url}: {ex}")
+                return None
+            finally:
+                pool.put(driver)
+
+        started = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                # start other drivers while scraping begins on self.browser
+                started = [ex.submit(self._create_driver) for _ in range(workers - 1)]
+                for future in started:
+                    future.add_done_callback(add_to_pool)
+                results = list(ex.map(task, urls))
+        finally:
+            # executor is shut down here, so no task uses these drivers
+            for future in started:
+                if future.exception() is None:
+                    future.result().quit()
+        return results
+
+    def _extract(self, driver: webdriver.Chrome, url: str) -> dict:
+        """Scraping info for product with given driver.
+
+        :param driver:
+            Chrome driver.
+        :param url:
+            Url to page.
+        :returns:
+            Info for product.
+        """
+
+        driver.get(url)
         try:
             try:
-                name_ele = WebDriverWait(self.browser, 10).until(EC.presence_of_element_located((By.CLASS_NAME, "x-item-title__mainTitle")))
+                # with eager page load carousel may appear after title
+                WebDriverWait(driver, 10).until(EC.all_of(EC.presence_of_element_located((By.CSS_SELECTOR, _NAME_SELECTOR)),
+                                                          EC.presence_of_element_located((By.CSS_SELECTOR, _IMG_SELECTOR))))
             except TimeoutException:
                 print("TimeoutException for page")
                 raise NoSuchElementException
-            name = name_ele.text
-            img_ele = self.browser.find_element(By.CSS_SELECTOR, "#PicturePanel .ux-image-carousel-container .zoom")
-            path_img = []
-            for img in img_ele.find_elements(By.CSS_SELECTOR, ".ux-image-carousel-item.image-treatment.image img"):
-                path_img.append(img.get_attribute("data-zoom-src"))
-                
-            price = self.browser.find_element(By.CSS_SELECTOR, ".x-price-section .x-bin-price__content .x-price-primary .ux-textspans").text
-            seller = self.browser.find_element(By.CLASS_NAME, "x-sellercard-atf__info__about-seller").get_attribute("title")
-            shipping_cost = self.browser.find_element(By.CSS_SELECTOR, f".ux-layout-section--shipping .ux-labels-values--shipping "
-                                                                       f".ux-labels-values__values .ux-textspans--BOLD").text
-            data = {"name": name,
-                    "path_img": path_img,
-                    "current_url": url,
-                    "price": price,
-                    "seller": seller,
-                    "shipping_cost": shipping_cost}
+
+            # read all fields in one WebDriver round-trip
+            data = driver.execute_script(_EXTRACT_JS)
+            missing = _missing_fields(data)
+            if missing:
+                raise NoSuchElementException(f"Elements not found: {', '.join(missing)}")
+            data["current_url"] = url
         except NoSuchElementException as ex:
             print(f"NoSuchElementException: {ex}")
             return None
         else:
             return data
-        finally:
-            self.browser.quit()
 
 
 if __name__ == "__main__":
-    ebay = EBay()
-    result = ebay.scrapper(TEST_URL)
-    if result:
-        ebay.write_to_console(result)
-        ebay.write_to_file(result)
+    with EBay() as ebay:
+        result = ebay.scrapper(TEST_URL)
+        if result:
+            ebay.write_to_console(result)
+            ebay.write_to_file(result)
@@ -1,7 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import orjson
 import requests
-from requests.exceptions import JSONDecodeError
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 from typing import Union, List, Dict
-import pandas as pd
 
 
 class RestCountries:
@@ -11,58 +15,98 @@ class RestCountries:
     :param _main_url:
         Url to api (private).
 
-    :param _fields:
+    :param _DEFAULT_FIELDS:
         Fields by default for every request (private).
+
+    :param _timeout:
+        Connect and read timeouts for every request (private).
     """
 
     _main_url = "https://restcountries.com/v3.1"
-    _fields={"fields": ["name", "capital", "flags"]}
+    _DEFAULT_FIELDS = ("name", "capital", "flags")
+    _timeout = (3.05, 10)
+
+    def __init__(self):
+        """Create cached HTTP session with connection pooling and retries.
+        Responses are stored in SQLite and revalidated after 24 hours.
+        """
+
+        retries = Retry(total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=12,
+                              max_retries=retries)
+
+        self._session = CachedSession("restcountries_cache",
+                                      backend="sqlite",
+                                      expire_after=timedelta(hours=24),
+                                      cache_control=True,
+                                      stale_if_error=True,
+                                      allowable_methods=("GET",))
+        self._session.mount("https://", adapter)
+        # default Accept-Encoding already includes br when brotli is installed
+        self._session.headers.update({"Accept": "application/json",
+                                      "User-Agent": "RestCountries/1.0"})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Close HTTP session."""
+
+        self._session.close()
 
-    def _print_table(self, data: List) -> None:
+    def clear_cache(self) -> None:
+        """Remove all cached responses."""
+
+        self._session.cache.clear()
+
+    def _print_table(self, data: List, title: str) -> None:
         """Print table to console.
+        Table is written at once so that concurrent calls don't mix up.
 
         :param data:
             Output data.
+
+        :param title:
+            Title printed above table.
         """
                 
-        for country in data:
-            country["name"] = country["name"]["common"]
-            if len(country["capital"]) == 0:
-                country["capital"] = "None"
-            elif len(country["capital"]) == 1:
-                country["capital"] = country["capital"][0]
-            country["flags"] = country["flags"]["png"]
-            
-        df = pd.DataFrame(data)
-        df = df[["name", "capital", "flags"]]
-        print(df.to_string(header=["Name", "Capital city", "Flag"],
-                           justify="center",
-                           index=False))
-        print("\n")
-
-    def _get_request(self, url: str, params=None) -> Union[None, List]:
+        header = ("Name", "Capital city", "Flag")
+        rows = [(c["name"]["common"],
+                 c["capital"][0] if c["capital"] else "None",
+                 c["flags"]["png"]) for c in data]
+
+        w0, w1, w2 = (max(len(r[i]) for r in (header, *rows))
+                      for i in range(len(header)))
+        lines = [f"{n:^{w0}}  {c:^{w1}}  {f:^{w2}}" for n, c, f in (header, *rows)]
+        print("\n".join((title, *lines)) + "\n\n\n", end="")
+
+    def _get_request(self, url: str, params: Dict) -> Union[None, List]:
         """Get request by url with parameters.
 
         :param url:
             Url for request.
 
         :param params:
-            Parameters for request (optional, default=None).
+            Parameters for request.
 
         :returns:
             Response to request.
         """
         
-        if params is None:
-            response = requests.get(url,
-                                    params=self._fields)
-        else:
-            response = requests.get(url,
-                                    params=params)
+        response = self._session.get(url,
+                                     params=params,
+                                     timeout=self._timeout)
         if response.status_code == requests.codes.ok:
             try:
-                result = response.json()
-            except JSONDecodeError as ex:
+                result = orjson.loads(response.content)
+            except orjson.JSONDecodeError as ex:
                 print(f"JSONDecodeError (get_all): {ex}")
                 return None
             else:
@@ -79,9 +123,10 @@ class RestCountries:
         """
         
         url = "/".join((self._main_url, "all"))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, "All countries")
             return True
         return False
 
@@ -96,9 +141,10 @@ class RestCountries:
         """
         
         url = "/".join((self._main_url, "name", name))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Name: {name}")
             return True
         return False
 
@@ -114,10 +160,10 @@ class RestCountries:
         """
         
         url = "/".join((self._main_url, "name", fullname))
-        self._fields["fullText"] = "true"
-        res = self._get_request(url, params=self._fields)
+        params = {"fields": list(self._DEFAULT_FIELDS), "fullText": "true"}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Full name: {fullname}")
             return True
         return False
 
@@ -136,16 +182,17 @@ class RestCountries:
             code = str(code)
 
         url = "/".join((self._main_url, "alpha", code))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
             if isinstance(res, list):
-                self._print_table(res)
+                self._print_table(res, f"Code: {code}")
             else:
-                self._print_table([res])
+                self._print_table([res], f"Code: {code}")
             return True
         return False
     
-    def get_by_listcodes(self, code: List[Union[int, str]]) -> bool:
+    def get_by_listcodes(self, code: Union[int, str, List[Union[int, str]]]) -> bool:
         """Search by list of country codes and display result.
 
         :param code:
@@ -155,11 +202,16 @@ class RestCountries:
             Operation status.
         """
 
+        # single code is treated as list with one code
+        if isinstance(code, (int, str)):
+            code = [code]
+
         url = "/".join((self._main_url, "alpha"))
-        self._fields["codes"] = code
-        res = self._get_request(url, params=self._fields)
+        params = {"fields": list(self._DEFAULT_FIELDS),
+                  "codes": ",".join(map(str, code))}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Codes: {params['codes']}")
             return True
         return False
 
@@ -174,9 +226,10 @@ class RestCountries:
         """
 
         url = "/".join((self._main_url, "currency", code))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Currency: {code}")
             return True
         return False
 
@@ -191,9 +244,10 @@ class RestCountries:
         """
 
         url = "/".join((self._main_url, "demonym", demonym))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Demonym: {demonym}")
             return True
         return False
 
@@ -208,9 +262,10 @@ class RestCountries:
         """
 
         url = "/".join((self._main_url, "lang", lang))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Language: {lang}")
             return True
         return False
 
@@ -226,9 +281,10 @@ class RestCountries:
         """
 
         url = "/".join((self._main_url, "capital", capital))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Capital city: {capital}")
             return True
         return False
 
@@ -243,9 +299,10 @@ class RestCountries:
         """
 
         url = "/".join((self._main_url, "region", region))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Region: {region}")
             return True
         return False
 
@@ -260,9 +317,10 @@ class RestCountries:
         """
 
         url = "/".join((self._main_url, "subregion", subregion))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Subregion: {subregion}")
             return True
         return False
         
@@ -276,25 +334,28 @@ class RestCountries:
         """
 
         url = "/".join((self._main_url, "translation", translation))
-        res = self._get_request(url)
+        params = {"fields": list(self._DEFAULT_FIELDS)}
+        res = self._get_request(url, params)
         if res:
-            self._print_table(res)
+            self._print_table(res, f"Translation: {translation}")
             return True
         return False
 
 
 if __name__ == "__main__":
-    country = RestCountries()
-    country.get_all()
-    country.get_by_name("deutschland")
-    country.get_by_fullname("Germany")
-    country.get_by_code("col")
-    country.get_by_listcodes([170,"pe"])
-    country.get_by_currency("cop")
-    country.get_by_demonym("peruvian")
-    country.get_by_lang("spanish")
-    country.get_by_capital("tallinn")
-    country.get_by_region("europe")
-    country.get_by_subregion("Northern Europe")
-    country.get_by_translation("germany")
-    
+    tasks = [("get_all", ()),
+             ("get_by_name", ("deutschland",)),
+             ("get_by_fullname", ("Germany",)),
+             ("get_by_code", ("col",)),
+             ("get_by_listcodes", ([170,"pe"],)),
+             ("get_by_currency", ("cop",)),
+             ("get_by_demonym", ("peruvian",)),
+             ("get_by_lang", ("spanish",)),
+             ("get_by_capital", ("tallinn",)),
+             ("get_by_region", ("europe",)),
+             ("get_by_subregion", ("Northern Europe",)),
+             ("get_by_translation", ("germany",))]
+
+    # requests are independent, run them concurrently
+    with RestCountries() as country, ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(lambda t: getattr(country, t[0])(*t[1]), tasks))